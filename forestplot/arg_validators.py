@@ -67,17 +67,11 @@ def check_data(
     ##########################################################################
     ## Check that CI options (ll, hl, form_ci_report) are consistent
     ##########################################################################
-    if ll is None:
-        try:
-            assert hl is None
-        except Exception:
-            raise TypeError("'ll' is None. 'hl' should also be None.")
-
-    if hl is None:
-        try:
-            assert ll is None
-        except Exception:
-            raise TypeError("'hl' is None. 'll' should also be None.")
+    if (ll is None) and (hl is not None):
+        raise TypeError("'ll' is None. 'hl' should also be None.")
+
+    if (hl is None) and (ll is not None):
+        raise TypeError("'hl' is None. 'll' should also be None.")
 
     if ll is None and form_ci_report:
         warnings.warn("'ll' is None. 'form_ci_report' will be set to False.")
@@ -88,50 +82,33 @@ def check_data(
     if not isinstance(dataframe, pd.core.frame.DataFrame):
         raise TypeError("Expect data as Pandas DataFrame")
 
-    if not ptypes.is_numeric_dtype(dataframe[estimate]):
-        try:
-            dataframe[estimate] = dataframe[estimate].astype(float)
-        except ValueError:
-            raise TypeError("Estimates should be float or int")
-
-    if (ll is not None) and (not ptypes.is_numeric_dtype(dataframe[ll])):
-        try:
-            dataframe[ll] = dataframe[ll].astype(float)
-        except ValueError:
-            raise TypeError("CI lowerlimit values should be float or int")
-
-    if (hl is not None) and (not ptypes.is_numeric_dtype(dataframe[hl])):
-        try:
-            dataframe[hl] = dataframe[hl].astype(float)
-        except ValueError:
-            raise TypeError("CI higherlimit values should be float or int")
+    numeric_cols = (
+        (estimate, "Estimates should be float or int"),
+        (ll, "CI lowerlimit values should be float or int"),
+        (hl, "CI higherlimit values should be float or int"),
+    )
+    for col, msg in numeric_cols:
+        # Already numeric (bool, int, uint, float, complex) columns are left untouched
+        if (col is not None) and (dataframe[col].dtype.kind not in "biufc"):
+            try:
+                dataframe[col] = dataframe[col].astype(float)
+            except ValueError:
+                raise TypeError(msg)
 
     ##########################################################################
     ## Check that the annotations and headers specified are list-like
     ##########################################################################
-    if annote is not None:
-        try:
-            assert ptypes.is_list_like(annote)
-        except Exception:
-            raise TypeError("annote should be list-like.")
-
-    if annoteheaders is not None:
-        try:
-            assert ptypes.is_list_like(annoteheaders)
-        except Exception:
-            raise TypeError("annoteheaders should be list-like.")
-
-    if rightannote is not None:
-        try:
-            assert ptypes.is_list_like(rightannote)
-        except Exception:
-            raise TypeError("rightannote should be list-like.")
-
-    if right_annoteheaders is not None:
-        try:
-            assert ptypes.is_list_like(right_annoteheaders)
-        except Exception:
-            raise TypeError("right_annoteheaders should be list-like.")
+    if (annote is not None) and (not ptypes.is_list_like(annote)):
+        raise TypeError("annote should be list-like.")
+
+    if (annoteheaders is not None) and (not ptypes.is_list_like(annoteheaders)):
+        raise TypeError("annoteheaders should be list-like.")
+
+    if (rightannote is not None) and (not ptypes.is_list_like(rightannote)):
+        raise TypeError("rightannote should be list-like.")
+
+    if (right_annoteheaders is not None) and (not ptypes.is_list_like(right_annoteheaders)):
+        raise TypeError("right_annoteheaders should be list-like.")
 
     ##########################################################################
     ## Check that annotations and corresponding headers have same length
@@ -150,20 +127,13 @@ def check_data(
         "est_ci",
         "formatted_pval",
     ]
+    available_fields = set(dataframe.columns).union(acceptable_annotations)
 
-    if annote is not None:
-        for col in annote:
-            try:
-                assert (col in dataframe.columns) or (col in acceptable_annotations)
-            except Exception:
-                raise AssertionError(f"the field {col} is not found in dataframe.")
-
-    if rightannote is not None:
-        for col in rightannote:
-            try:
-                assert (col in dataframe.columns) or (col in acceptable_annotations)
-            except Exception:
-                raise AssertionError(f"the field {col} is not found in dataframe.")
+    for annotations in (annote, rightannote):
+        if annotations is not None:
+            for col in annotations:
+                if col not in available_fields:
+                    raise AssertionError(f"the field {col} is not found in dataframe.")
 
     if groupvar is not None:
         check_groups(dataframe, groupvar=groupvar, group_order=group_order)
@@ -190,8 +160,6 @@ def check_data(
         )
 
     if (rightannote is not None) and (varlabel in rightannote):
-        warnings.warn(f"{varlabel} is a variable is already printed.")
-        # warnings.warn(f'Specifying {varlabel} in "rightannote" will lead to duplicate printing of {varlabel}.')
         warnings.warn(
             f'{varlabel} is a variable is already printed. Specifying {varlabel} in "rightannote" will lead to duplicate printing of {varlabel}.'
         )
@@ -212,11 +180,9 @@ def check_data(
 
     # Warn: duplicates found in varlabels and grouplabels
     if groupvar is not None:
-        grouplabels = dataframe[groupvar].dropna().unique()
-        grouplabels = [grplab_str.lower().strip() for grplab_str in grouplabels]
-        varlabels = dataframe[varlabel].dropna().unique()
-        varlabels = [varlab_str.lower().strip() for varlab_str in varlabels]
-        if any(varlab_str in grouplabels for varlab_str in varlabels):
+        grouplabels = set(dataframe[groupvar].dropna().str.lower().str.strip())
+        varlabels = dataframe[varlabel].dropna().str.lower().str.strip()
+        if varlabels.isin(grouplabels).any():
             warnings.warn(
                 "Duplicates found in variable labels ('varlabel') and group labels ('groupvar'). Formatting of y-axis labels may lead to unexpected errors."
             )
@@ -232,8 +198,11 @@ def check_data(
 def check_iterables_samelen(*args):  # type: ignore
     """Assert that provided iterables have same length."""
     try:
-        assert all(len(args[0]) == len(_arg) for _arg in args[1:])
-    except Exception:
+        first_len = len(args[0])
+        samelen = all(len(_arg) == first_len for _arg in args[1:])
+    except (IndexError, TypeError):  # no iterables, or one without a length
+        samelen = False
+    if not samelen:
         raise ValueError("Iterables not of the same length.")
     return None
 
@@ -267,8 +236,6 @@ def check_groups(
         check_iterables_samelen(groups, group_order)
     # Check that groups in group_order exists
     if (group_order is not None) and (groupvar is not None):
-        try:
-            assert all(group in groups for group in group_order)
-        except Exception:
+        if not all(group in groups for group in group_order):
             raise AssertionError("Groups specified in `group_order` should exist in the data.")
     return None
@@ -1,9 +1,13 @@
 """Holds functions to check prepare dataframe for plotting."""
+import functools
+import importlib.util
 from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
 
+AVAILABLE_DATA = ("mortality", "sleep", "sleep-untruncated")
+
 
 def insert_groups(
     dataframe: pd.core.frame.DataFrame, groupvar: str, varlabel: str
@@ -25,12 +29,16 @@ def insert_groups(
     -------
             pd.core.frame.DataFrame with group variable labels inserted as psuedo variables.
     """
-    df_groupsasvar = pd.DataFrame()
-    for group in dataframe[groupvar].unique():
-        _df = dataframe.query(f"{groupvar}==@group")
-        addgroupvar = pd.DataFrame({varlabel: [group], groupvar: [group]})
-        df_groupsasvar = pd.concat([df_groupsasvar, addgroupvar, _df], ignore_index=True)
-    return df_groupsasvar
+    codes, groups = pd.factorize(dataframe[groupvar])  # groups in order of appearance
+    groups = np.asarray(groups, dtype=object)
+    addgroupvar = pd.DataFrame({varlabel: groups, groupvar: groups})
+    df_groupsasvar = pd.concat([addgroupvar, dataframe], ignore_index=True)
+
+    # Stable sort on group code puts each group label right before its rows
+    group_codes = np.concatenate([np.arange(len(groups)), codes])
+    order = np.argsort(group_codes, kind="stable")
+    order = order[group_codes[order] >= 0]  # rows without a group are dropped
+    return df_groupsasvar.iloc[order].reset_index(drop=True)
 
 
 def sort_groups(
@@ -96,21 +104,19 @@ def sort_data(
         if sortby is None:
             sortby = estimate
 
+        # ignore_index renumbers the rows while sorting, so no reset_index copy afterwards
         if groupvar is not None:
-            dataframe.sort_values(
-                [groupvar, sortby], ascending=[True, sortascend], inplace=True
+            return dataframe.sort_values(
+                [groupvar, sortby], ascending=[True, sortascend], ignore_index=True
             )
-        else:
-            dataframe.sort_values(sortby, ascending=sortascend, inplace=True)
-        return dataframe.reset_index(drop=True)
+        return dataframe.sort_values(sortby, ascending=sortascend, ignore_index=True)
     else:
         return dataframe
 
 
 def reverse_dataframe(dataframe: pd.core.frame.DataFrame) -> pd.core.frame.DataFrame:
     """Flip the dataframe so that last row is now first and so on."""
-    dataframe = dataframe[::-1]
-    return dataframe.reset_index(drop=True)
+    return dataframe.iloc[::-1].reset_index(drop=True)
 
 
 def insert_empty_row(dataframe: pd.core.frame.DataFrame) -> pd.core.frame.DataFrame:
@@ -124,8 +130,10 @@ def load_data(name: str, **param_dict: Optional[Any]) -> pd.core.frame.DataFrame
     """
     Load example dataset for quickstart.
 
-    Example data available now:
+    Example data available now (see 'AVAILABLE_DATA'):
             - mortality
+            - sleep
+            - sleep-untruncated
 
     The source of these data will be from: https://github.com/LSYS/forestplot/tree/main/examples/data.
 
@@ -138,16 +146,50 @@ def load_data(name: str, **param_dict: Optional[Any]) -> pd.core.frame.DataFrame
     -------
     pd.core.frame.DataFrame.
     """
-    available_data = ["mortality", "sleep", "sleep-untruncated"]
     name = name.lower().strip()
-    if name in available_data:
-        url = (
-            f"https://raw.githubusercontent.com/lsys/forestplot/main/examples/data/{name}.csv"
-        )
-        df = pd.read_csv(url, **param_dict)
-        if name == "sleep":
-            df["n"] = df["n"].astype("str")
-        return df
+    if name in AVAILABLE_DATA:
+        if param_dict:  # read options can be unhashable, so only the plain load is cached
+            return _fetch_data(name, **param_dict)
+        return _fetch_data_cached(name).copy(deep=True)
     else:
-        available_data_str = ", ".join(available_data)
+        available_data_str = ", ".join(AVAILABLE_DATA)
         raise AssertionError(f"{name} not found. Should be one of '{available_data_str}'")
+
+
+def _fetch_data(name: str, **param_dict: Optional[Any]) -> pd.core.frame.DataFrame:
+    """Download and read example dataset 'name' (see 'load_data')."""
+    url = f"https://raw.githubusercontent.com/lsys/forestplot/main/examples/data/{name}.csv"
+    df = _read_csv(url, **param_dict)
+    if name == "sleep":
+        df["n"] = df["n"].astype("str")
+    return df
+
+
+@functools.lru_cache(maxsize=len(AVAILABLE_DATA))
+def _fetch_data_cached(name: str) -> pd.core.frame.DataFrame:
+    """Fetch example dataset 'name' once per session. Callers must not mutate the result."""
+    return _fetch_data(name)
+
+
+def _read_csv(url: str, **param_dict: Optional[Any]) -> pd.core.frame.DataFrame:
+    """
+    Read csv with the pyarrow engine if pyarrow is installed, else with the default engine.
+
+    Falls back to the default engine if 'param_dict' has options the pyarrow engine does not
+    support. An engine passed in 'param_dict' is always respected.
+
+    Parameters
+    ----------
+    url (str)
+            Path or url to the csv file.
+
+    Returns
+    -------
+    pd.core.frame.DataFrame.
+    """
+    if ("engine" not in param_dict) and (importlib.util.find_spec("pyarrow") is not None):
+        try:
+            return pd.read_csv(url, engine="pyarrow", **param_dict)
+        except ValueError:  # option not supported by the pyarrow engine
+            pass
+    return pd.read_csv(url, **param_dict)
@@ -227,9 +227,9 @@ def draw_pval_right(
         inv = ax.transData.inverted()
         righttext_width = 0
         fig = plt.gcf()
-        for _, row in dataframe.iterrows():
-            yticklabel1 = row[yticklabel]
-            yticklabel2 = row["formatted_pval"]
+        for yticklabel1, yticklabel2 in dataframe[[yticklabel, "formatted_pval"]].itertuples(
+            index=False, name=None
+        ):
             if pd.isna(yticklabel2):
                 yticklabel2 = ""
 
@@ -326,9 +326,9 @@ def draw_yticklabel2(
     inv = ax.transData.inverted()
     righttext_width = 0
     fig = plt.gcf()
-    for ix, row in dataframe.iterrows():
-        yticklabel1 = row["yticklabel"]
-        yticklabel2 = row["yticklabel2"]
+    for ix, yticklabel1, yticklabel2 in dataframe[["yticklabel", "yticklabel2"]].itertuples(
+        index=True, name=None
+    ):
 
         extrapad = 0.05
         pad = ax.get_xlim()[1] * (1 + extrapad)
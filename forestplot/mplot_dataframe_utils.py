@@ -35,17 +35,19 @@ def insert_group_model(
     models = dataframe[model_col].unique()
     groups = dataframe[groupvar].unique()
 
-    df_groupmodel_asvar = pd.DataFrame()
+    model_values = dataframe[model_col].to_numpy()
+    group_values = dataframe[groupvar].to_numpy()
+
+    frames = []
     for model in models:
+        in_model = model_values == model
         for group in groups:
-            _df = dataframe.query(f"{model_col}==@model and {groupvar}==@group")
+            _df = dataframe[in_model & (group_values == group)]
             addgroupvar = pd.DataFrame(
                 {varlabel: [group], groupvar: [group], model_col: [model]}
             )
-            df_groupmodel_asvar = pd.concat(
-                [df_groupmodel_asvar, addgroupvar, _df], ignore_index=True
-            )
-    return df_groupmodel_asvar
+            frames.extend([addgroupvar, _df])
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
 
 def _insert_headers_models(
@@ -77,12 +79,13 @@ def _insert_headers_models(
     if models is None:
         models = dataframe[model_col].unique()
 
-    df = pd.DataFrame()
+    model_values = dataframe[model_col].to_numpy()
+
+    frames = []
     for model in models:
-        _df = dataframe.query(f"{model_col}==@model")
-        _df = insert_empty_row(_df)
-        df = pd.concat([df, _df], ignore_index=True)
-    return df
+        _df = dataframe[model_values == model]
+        frames.append(insert_empty_row(_df))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
 
 def make_multimodel_tableheaders(
@@ -190,14 +193,9 @@ def make_multimodel_tableheaders(
     else:
         right_headers = ""
 
-    # Fill in the na
-    c = 0
-    for ix in indices:
-        dataframe.loc[ix, "yticklabel"], dataframe.loc[ix, "yticklabel2"] = (
-            left_headers,
-            right_headers,
-        )
-        dataframe.loc[ix, model_col] = models[c]
-        c += 1
+    # Fill in the na, one column at a time for all header rows
+    dataframe.loc[indices, "yticklabel"] = left_headers
+    dataframe.loc[indices, "yticklabel2"] = right_headers
+    dataframe.loc[indices, model_col] = list(models[: len(indices)])
 
     return dataframe
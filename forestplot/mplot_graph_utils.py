@@ -367,8 +367,7 @@ def mdraw_yticklabel2(
     fig = plt.gcf()
     extrapad = 0.03
     pad = ax.get_xlim()[1] * (1 + extrapad)
-    for ix, row in dataframe.reset_index().iterrows():
-        ticklabel = row["yticklabel2"]
+    for ix, ticklabel in enumerate(dataframe["yticklabel2"]):
         if (ix == top_row_ix) and (
             annoteheaders is not None or right_annoteheaders is not None
         ):
@@ -1,5 +1,5 @@
 """Holds functions to prepare the strings and text in the dataframe."""
-from typing import Any, Optional, Sequence, Union
+from typing import Any, List, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -43,7 +43,7 @@ def form_est_ci(
 
     Helpers
     -------
-            _right_justify_num
+            _right_justify_nums
 
     Returns
     -------
@@ -53,17 +53,19 @@ def form_est_ci(
         cols = [estimate]
     else:
         cols = [estimate, ll, hl]
-    for col in cols:
-        dataframe = _right_justify_num(
-            dataframe=dataframe, col=col, decimal_precision=decimal_precision
+    dataframe = _right_justify_nums(
+        dataframe=dataframe, cols=cols, decimal_precision=decimal_precision
+    )
+    if ll is not None:
+        ci_range = (
+            caps[0]
+            + dataframe[f"formatted_{ll}"]
+            + connector
+            + dataframe[f"formatted_{hl}"]
+            + caps[1]
         )
-    for ix, row in dataframe.iterrows():
-        formatted_est = row[f"formatted_{estimate}"]
-        if ll is not None:
-            formatted_ll, formatted_hl = row[f"formatted_{ll}"], row[f"formatted_{hl}"]
-            formatted_ci = "".join([caps[0], formatted_ll, connector, formatted_hl, caps[1]])
-            dataframe.loc[ix, "ci_range"] = formatted_ci
-            dataframe.loc[ix, "est_ci"] = "".join([formatted_est, formatted_ci])
+        dataframe["ci_range"] = ci_range
+        dataframe["est_ci"] = dataframe[f"formatted_{estimate}"] + ci_range
     return dataframe
 
 
@@ -105,20 +107,27 @@ def star_pval(
         symbols = kwargs.get("symbols", ("***", "**", "*"))
 
         check_iterables_samelen(thresholds, symbols)
-        for ix, row in dataframe.iterrows():
-            val = row[pval]
-            if (np.isnan(val)) or (val == "nan") or (val == ""):
-                dataframe.loc[ix, "formatted_pval"] = ""
-                continue
-
-            dec_formatted_pval = round(val, decimal_precision)
-            dataframe.loc[ix, "formatted_pval"] = str(dec_formatted_pval)
-            if starpval:
-                for iy, threshold in enumerate(thresholds):
-                    if val <= threshold:
-                        _pval = "".join([str(dec_formatted_pval), symbols[iy]])
-                        dataframe.loc[ix, "formatted_pval"] = _pval
-                        break
+        pvals = dataframe[pval]
+        # Python's round() on the values, which can differ from np.round() near ties
+        formatted_pval = pd.Series(
+            [str(round(val, decimal_precision)) for val in pvals.tolist()],
+            index=dataframe.index,
+            dtype=object,
+        )
+        if starpval and len(thresholds) > 0:
+            # First threshold (in the order given) that the p-value is within
+            _pvals = pvals.to_numpy(dtype=float)
+            _thresholds = np.asarray(thresholds, dtype=float)
+            if np.all(_thresholds[:-1] <= _thresholds[1:]):
+                # Ascending thresholds: binary search, past-the-end index means no symbol
+                _symbols = np.append(np.asarray(symbols, dtype=object), "")
+                stars = _symbols[np.searchsorted(_thresholds, _pvals, side="left")]
+            else:
+                stars = np.select(
+                    [_pvals <= threshold for threshold in thresholds], symbols, default=""
+                )
+            formatted_pval = formatted_pval + stars
+        dataframe["formatted_pval"] = formatted_pval.where(pvals.notna(), "")
     return dataframe
 
 
@@ -144,21 +153,19 @@ def indent_nongroupvar(
     varindent (int)
             Amount of whitespace to indent the variables when grouping of variables is used.
 
+    Helpers
+    -------
+            _get_groups
+
     Returns
     -------
             pd.core.frame.DataFrame with nongroup variables in 'varlabel' indented by stated amount.
     """
-    if varindent > 0:
-        if groupvar is not None:
-            groups = [gr.lower() for gr in dataframe[groupvar].unique()]
-
-        for ix, row in dataframe.iterrows():
-            label = row[varlabel]
-            if (groupvar is not None) and (label.lower() not in groups):
-                label = label.rjust(varindent + len(label))
-            else:
-                label = label.rjust(len(label))
-            dataframe.loc[ix, varlabel] = label
+    if (varindent > 0) and (groupvar is not None):
+        groups = _get_groups(dataframe=dataframe, groupvar=groupvar)
+        labels = dataframe[varlabel]
+        is_group = labels.str.lower().str.strip().isin(groups)
+        dataframe[varlabel] = labels.where(is_group, "".ljust(varindent) + labels)
     return dataframe
 
 
@@ -185,17 +192,11 @@ def normalize_varlabels(
     -------
             pd.core.frame.DataFrame with the varlabel column normalized.
     """
-    if capitalize:
-        if capitalize == "title":
-            dataframe[varlabel] = dataframe[varlabel].str.title()
-        elif capitalize == "capitalize":
-            dataframe[varlabel] = dataframe[varlabel].str.capitalize()
-        elif capitalize == "lower":
-            dataframe[varlabel] = dataframe[varlabel].str.lower()
-        elif capitalize == "upper":
-            dataframe[varlabel] = dataframe[varlabel].str.upper()
-        elif capitalize == "swapcase":
-            dataframe[varlabel] = dataframe[varlabel].str.swapcase()
+    if capitalize in ("title", "capitalize", "lower", "upper", "swapcase"):
+        labels = dataframe[varlabel]
+        normalized = getattr(labels.str, capitalize)()
+        if not normalized.equals(labels):  # Leave column as is if already normalized
+            dataframe[varlabel] = normalized
     return dataframe
 
 
@@ -222,47 +223,40 @@ def format_varlabels(
             If True, form the formatted confidence interval as a string.
     ci_report (bool)
             If True, form the formatted confidence interval as a string.
-    column2 (str)
-            Name of column containing the second column of annotation to be printed.
     groupvar (str)
             Name of column containing group of variables.
     extrapad (int)
             Amount of padding between variable label and the estimate + confidence interval formatted string.
-    varindent (int)
-            Amount of whitespace to indent the variables when grouping of variables is used.
 
     Helpers
     -------
             _get_max_varlen
-            _format_secondcolumn
+            _get_groups
             _remove_est_ci
 
     Returns
     -------
             pd.core.frame.DataFrame with an additional 'yticklabel' column.
     """
-    if form_ci_report:
+    # Normalize the labels once for both the group-header lookups below
+    labels_lower = None
+    if groupvar is not None:
+        labels_lower = dataframe[varlabel].str.lower().str.strip()
+
+    if form_ci_report and ci_report:
         pad = _get_max_varlen(dataframe=dataframe, varlabel=varlabel, extrapad=extrapad)
-        for ix, row in dataframe.iterrows():
-            var = row[varlabel]
-            if ci_report:
-                est_ci = row["est_ci"]
-            else:
-                est_ci = ""
-                pad = 0
-
-            if groupvar is not None:
-                groups = [gr.lower() for gr in dataframe[groupvar].unique()]
-                if var.lower() in groups:  # If row is a group header
-                    yticklabel = var
-                else:  # indent variable labels
-                    yticklabel = "".join([var.ljust(pad), est_ci])
-            else:
-                yticklabel = "".join([var.ljust(pad), est_ci])
-            dataframe.loc[ix, "yticklabel"] = yticklabel
-    else:
+        labels = dataframe[varlabel]
+        yticklabel = labels.str.ljust(pad) + dataframe["est_ci"]
+        if groupvar is not None:  # group headers are left as they are
+            groups = _get_groups(dataframe=dataframe, groupvar=groupvar)
+            is_group = labels_lower.isin(groups)
+            yticklabel = yticklabel.where(~is_group, labels)
+        dataframe["yticklabel"] = yticklabel
+    else:  # without the ci report, yticklabel is just the variable label
         dataframe["yticklabel"] = dataframe[varlabel]
-    dataframe = _remove_est_ci(dataframe=dataframe, varlabel=varlabel, groupvar=groupvar)
+    dataframe = _remove_est_ci(
+        dataframe=dataframe, varlabel=varlabel, groupvar=groupvar, labels_lower=labels_lower
+    )
     return dataframe
 
 
@@ -270,6 +264,7 @@ def _remove_est_ci(
     dataframe: pd.core.frame.DataFrame,
     varlabel: str,
     groupvar: Optional[str],
+    labels_lower: Optional[pd.Series] = None,
 ) -> pd.core.frame.DataFrame:
     """
     Make rows for 'est_ci' and 'ci_range' empty string '' if row is a group variable label.
@@ -283,17 +278,21 @@ def _remove_est_ci(
             Name of column containing the variable label to be printed out.
     groupvar (str)
             Name of column containing group of variables.
+    labels_lower (pd.Series)
+            'varlabel' already lowercased and stripped, if the caller has it.
 
     Returns
     -------
             pd.core.frame.DataFrame.
     """
     if groupvar is not None:
-        for ix, row in dataframe.iterrows():
-            var = row[varlabel]
-            grouplabel = row[groupvar]
-            if var.lower().strip() == grouplabel.lower().strip():  # If row is a group header
-                dataframe.loc[ix, "ci_range"], dataframe.loc[ix, "est_ci"] = "", ""
+        labels = labels_lower
+        if labels is None:
+            labels = dataframe[varlabel].str.lower().str.strip()
+        grouplabels = dataframe[groupvar].str.lower().str.strip()
+        is_group = labels == grouplabels  # If row is a group header
+        if is_group.any():
+            dataframe.loc[is_group, ["ci_range", "est_ci"]] = ""
     return dataframe
 
 
@@ -319,10 +318,36 @@ def _get_max_varlen(
     -------
             int
     """
-    max_varlen = dataframe[varlabel].map(str).str.len().max()
+    varlens = dataframe[varlabel].astype(str).str.len()
+    max_varlen = int(varlens.max()) if len(varlens) else 0
     return max_varlen + extrapad
 
 
+def _get_groups(
+    dataframe: pd.core.frame.DataFrame,
+    groupvar: Optional[str],
+) -> frozenset:
+    """
+    Get the lowercased and stripped group labels in dataframe.
+
+    Parameters
+    ----------
+    dataframe (pandas.core.frame.DataFrame)
+            Pandas DataFrame where rows are variables. Columns are variable name, estimates,
+            margin of error, etc.
+    groupvar (str)
+            Name of column containing group of variables.
+
+    Returns
+    -------
+            frozenset of normalized group labels. Empty if 'groupvar' is None.
+    """
+    if groupvar is None:
+        return frozenset()
+    groups = dataframe[groupvar]
+    return frozenset(str(gr).lower().strip() for gr in groups.dropna().unique())
+
+
 def prep_annote(
     dataframe: pd.core.frame.DataFrame,
     annote: Optional[Union[Sequence[str], None]],
@@ -351,45 +376,31 @@ def prep_annote(
 
     Helpers
     -------
+            _format_annotations
             _get_max_varlen
+            _get_groups
 
     Returns
     -------
             pd.core.frame.DataFrame with an additional formatted 'yticklabel' column.
     """
     col_spacing = kwargs.get("col_spacing", 2)
-
-    lookup_annote_len = {}
-    for ix, annotation in enumerate(annote):
-        # Get max len for padding
-        _pad = _get_max_varlen(dataframe=dataframe, varlabel=annotation, extrapad=0)
-        if annoteheaders is not None:  # Check that max len exceeds header length
-            _header = annoteheaders[ix]
-            _pad = max(_pad, len(_header))
-        lookup_annote_len[ix] = _pad
-        for iy, row in dataframe.iterrows():  # Make individual formatted_annotations
-            _annotation = str(row[annotation]).ljust(_pad)
-            dataframe.loc[iy, f"formatted_{annotation}"] = _annotation
+    dataframe = _format_annotations(
+        dataframe=dataframe, annote=annote, annoteheaders=annoteheaders
+    )
 
     # get max length for variables
     pad = _get_max_varlen(dataframe=dataframe, varlabel=varlabel, extrapad=0)
+    spacing = "".ljust(col_spacing)
 
-    if groupvar is not None:
-        groups = [gr.lower() for gr in dataframe[groupvar].unique()]
-    else:
-        groups = []
-
-    for ix, row in dataframe.iterrows():
-        yticklabel = row[varlabel]
-        if yticklabel.lower().strip() in groups:
-            dataframe.loc[ix, "yticklabel"] = yticklabel
-        else:
-            yticklabel = yticklabel.ljust(pad)
-            for annotation in annote:
-                _annotation = row[f"formatted_{annotation}"]
-                spacing = "".ljust(col_spacing)
-                yticklabel = spacing.join([yticklabel, _annotation])
-            dataframe.loc[ix, "yticklabel"] = yticklabel
+    groups = _get_groups(dataframe=dataframe, groupvar=groupvar)
+    labels = dataframe[varlabel]
+    is_group = labels.str.lower().str.strip().isin(groups)
+
+    yticklabel = labels.str.ljust(pad).str.cat(
+        [dataframe[f"formatted_{annotation}"] for annotation in annote], sep=spacing
+    )
+    dataframe["yticklabel"] = yticklabel.where(~is_group, labels)
     return dataframe
 
 
@@ -421,47 +432,63 @@ def prep_rightannnote(
 
     Helpers
     -------
-            _get_max_varlen
+            _format_annotations
+            _get_groups
 
     Returns
     -------
             pd.core.frame.DataFrame with an additional formatted 'yticklabel2' column.
     """
     col_spacing = kwargs.get("col_spacing", 2)
+    dataframe = _format_annotations(
+        dataframe=dataframe, annote=rightannote, annoteheaders=right_annoteheaders
+    )
 
-    lookup_annote_len = {}
-    for ix, annotation in enumerate(rightannote):
-        # Get max len for padding
-        _pad = _get_max_varlen(dataframe=dataframe, varlabel=annotation, extrapad=0)
-        if right_annoteheaders is not None:  # Check that max len exceeds header length
-            _header = right_annoteheaders[ix]
-            _pad = max(_pad, len(_header))
-        lookup_annote_len[ix] = _pad
+    if len(rightannote) == 0:  # No columns to join
+        dataframe["yticklabel2"] = ""
+        return dataframe
+    spacing = "".ljust(col_spacing)
 
-        for iy, row in dataframe.iterrows():
-            _annotation = row[annotation]
-            _annotation = str(_annotation).ljust(_pad)
-            dataframe.loc[iy, f"formatted_{annotation}"] = _annotation
+    groups = _get_groups(dataframe=dataframe, groupvar=groupvar)
+    is_group = dataframe[varlabel].str.lower().str.strip().isin(groups)
 
-    if groupvar is not None:
-        groups = [gr.lower() for gr in dataframe[groupvar].unique()]
-    else:
-        groups = []
-
-    for ix, row in dataframe.iterrows():
-        yticklabel = row[varlabel]
-        yticklabel2 = ""
-        if yticklabel.lower().strip() in groups:
-            dataframe.loc[ix, "yticklabel2"] = ""
-        else:
-            for annotation in rightannote:
-                _annotation = row[f"formatted_{annotation}"]
-                spacing = "".ljust(col_spacing)
-                if yticklabel2 == "":
-                    yticklabel2 = _annotation
-                else:
-                    yticklabel2 = spacing.join([yticklabel2, _annotation])
-            dataframe.loc[ix, "yticklabel2"] = yticklabel2
+    first, *rest = [dataframe[f"formatted_{annotation}"] for annotation in rightannote]
+    yticklabel2 = first.str.cat(rest, sep=spacing)
+    dataframe["yticklabel2"] = yticklabel2.where(~is_group, "")
+    return dataframe
+
+
+def _format_annotations(
+    dataframe: pd.core.frame.DataFrame,
+    annote: Sequence[str],
+    annoteheaders: Optional[Union[Sequence[str], None]],
+) -> pd.core.frame.DataFrame:
+    """
+    Left-justify each annotation column to its max length (or its header length if longer).
+
+    Each column is cast to string once and the cast is reused for both the padding and the
+    formatted column.
+
+    Parameters
+    ----------
+    dataframe (pandas.core.frame.DataFrame)
+            Pandas DataFrame where rows are variables. Columns are variable name, estimates,
+            margin of error, etc.
+    annote (list-like)
+            List of columns to format as annotations.
+    annoteheaders (list-like)
+            List of table headers corresponding to the annotations.
+
+    Returns
+    -------
+            pd.core.frame.DataFrame with an additional 'formatted_' column per annotation.
+    """
+    for ix, annotation in enumerate(annote):
+        _annotation = dataframe[annotation].astype(str)
+        _pad = _annotation.str.len().max()
+        if annoteheaders is not None:  # Check that max len exceeds header length
+            _pad = max(_pad, len(annoteheaders[ix]))
+        dataframe[f"formatted_{annotation}"] = _annotation.str.ljust(_pad)
     return dataframe
 
 
@@ -513,34 +540,39 @@ def make_tableheaders(
     spacing = "".ljust(col_spacing)
 
     variable_header = kwargs.get("variable_header", "Variable")
-    dataframe = insert_empty_row(dataframe)
 
+    # get max length for each annotation column once, even if shared by both sides.
+    # Measure before adding the header row, on the same rows as the formatted columns
+    header_cols: List[str] = []
+    if annoteheaders is not None:
+        header_cols.extend(annote)
+    if right_annoteheaders is not None:
+        header_cols.extend(rightannote)
+    lookup_pad = {
+        col: _get_max_varlen(dataframe=dataframe, varlabel=col, extrapad=0)
+        for col in set(header_cols)
+    }
     pad = _get_max_varlen(dataframe=dataframe, varlabel=varlabel, extrapad=0)
+
+    dataframe = insert_empty_row(dataframe)
     left_headers = variable_header.ljust(pad)
-    dataframe.loc[0, "yticklabel"] = left_headers
     if annoteheaders is not None:
         for ix, header in enumerate(annoteheaders):
-            corresponding_col = annote[ix]
-            # get max length for variables
-            pad = _get_max_varlen(dataframe=dataframe, varlabel=corresponding_col, extrapad=0)
-            pad = max(pad, len(header))
+            pad = max(lookup_pad[annote[ix]], len(header))
             left_headers = spacing.join([left_headers, header.ljust(pad)])
-        dataframe.loc[0, "yticklabel"] = left_headers
 
+    right_headers = ""
     if right_annoteheaders is not None:
-        right_headers = ""
         for ix, header in enumerate(right_annoteheaders):
-            corresponding_col = rightannote[ix]
-            # get max length for variables
-            pad = _get_max_varlen(dataframe=dataframe, varlabel=corresponding_col, extrapad=0)
-            pad = max(pad, len(header))
+            pad = max(lookup_pad[rightannote[ix]], len(header))
             if right_headers == "":
                 right_headers = header.ljust(pad)
             else:
                 right_headers = spacing.join([right_headers, header.ljust(pad)])
-        dataframe.loc[0, "yticklabel2"] = right_headers
-    else:
-        dataframe.loc[0, "yticklabel2"] = ""
+
+    # Build both header strings first, then write the header row once
+    dataframe.loc[0, "yticklabel"] = left_headers
+    dataframe.loc[0, "yticklabel2"] = right_headers
     return dataframe
 
 
@@ -562,15 +594,41 @@ def _right_justify_num(
 
     Helpers
     -------
-            _get_max_varlen
+            _right_justify_nums
 
     Returns
     -------
             pd.core.frame.DataFrame with additional column for the formatted numeric column.
     """
-    dataframe[f"formatted_{col}"] = (
-        dataframe[col].apply(lambda x: f"{x:0.{decimal_precision}f}").astype(str)
+    return _right_justify_nums(
+        dataframe=dataframe, cols=[col], decimal_precision=decimal_precision
     )
-    pad = _get_max_varlen(dataframe=dataframe, varlabel=f"formatted_{col}", extrapad=0)
-    dataframe[f"formatted_{col}"] = dataframe[f"formatted_{col}"].apply(lambda x: x.rjust(pad))
+
+
+def _right_justify_nums(
+    dataframe: pd.core.frame.DataFrame, cols: Sequence[str], decimal_precision: int
+) -> pd.core.frame.DataFrame:
+    """
+    Format several numeric columns according to the decimal precision and variable length.
+
+    Each column is right-justified to its own max length, as in '_right_justify_num'.
+
+    Parameters
+    ----------
+    dataframe (pandas.core.frame.DataFrame)
+            Pandas DataFrame where rows are variables. Columns are variable name, estimates,
+            margin of error, etc.
+    cols (list-like)
+            Names of numeric columns to format.
+    decimal_precision (int)
+            Precision of 2 means we go from '0.1234' -> '0.12'.
+
+    Returns
+    -------
+            pd.core.frame.DataFrame with additional columns for the formatted numeric columns.
+    """
+    for col in cols:
+        formatted = dataframe[col].map(lambda x: f"{x:0.{decimal_precision}f}")
+        pad = int(formatted.str.len().max()) if len(formatted) else 0
+        dataframe[f"formatted_{col}"] = formatted.str.rjust(pad)
     return dataframe
@@ -0,0 +1,41 @@
+import matplotlib
+
+matplotlib.use("Agg", force=True)  # headless backend: no GUI toolkit import, same rendering
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pandas as pd  # noqa: E402
+import pytest  # noqa: E402
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: network/plot-heavy tests (deselect with -m 'not slow')"
+    )
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close every figure a test opened so pyplot does not keep them for the whole run."""
+    yield
+    plt.close("all")
+
+
+@pytest.fixture(scope="session")
+def input_df():
+    """Results table shared by the graph_utils and mplot_graph_utils tests (do not mutate)."""
+    x, y = [0, 1, 2], [0, 1, 2]
+    str_vector = ["a", "b", "c"]
+    return pd.DataFrame(
+        {
+            "yticklabel": str_vector,
+            "model": ["m1", "m1", "m2"],
+            "estimate": x,
+            "moerror": y,
+            "ll": x,
+            "hl": y,
+            "pval": y,
+            "formatted_pval": y,
+            "yticklabel1": str_vector,
+            "yticklabel2": str_vector,
+        }
+    )
@@ -14,48 +14,6 @@ def test_check_data():
     string = ["a", "b", "c"]
     numeric = [-1, 2, 3.0]
 
-    # Assert that assertion for numeric type for estimate works
-    _df = pd.DataFrame({"estimate": string})
-    with pytest.raises(TypeError) as excinfo:
-        check_data(dataframe=_df, estimate="estimate", varlabel="estimate")
-    assert str(excinfo.value) == "Estimates should be float or int"
-
-    # Assert that conversion for numeric estimate stored as string works
-    _df = pd.DataFrame({"estimate": numeric_as_string, "varlabel": string})
-    check_data(dataframe=_df, estimate="estimate", varlabel="varlabel")
-
-    # Assert that assertion for numeric type for ll works
-    _df = pd.DataFrame({"estimate": numeric, "ll": string, "hl": numeric})
-    with pytest.raises(TypeError) as excinfo:
-        check_data(dataframe=_df, estimate="estimate", varlabel="estimate", ll="ll", hl="hl")
-    assert str(excinfo.value) == "CI lowerlimit values should be float or int"
-
-    # Assert that conversion for numeric ll stored as string works
-    _df = pd.DataFrame(
-        {
-            "estimate": numeric_as_string,
-            "ll": numeric_as_string,
-            "hl": numeric_as_string,
-        }
-    )
-    check_data(dataframe=_df, estimate="estimate", varlabel="estimate", ll="ll", hl="hl")
-
-    # Assert that assertion for numeric type for hl works
-    _df = pd.DataFrame({"estimate": numeric, "ll": numeric, "hl": string})
-    with pytest.raises(TypeError) as excinfo:
-        check_data(dataframe=_df, estimate="estimate", varlabel="estimate", ll="ll", hl="hl")
-    assert str(excinfo.value) == "CI higherlimit values should be float or int"
-
-    # Assert that conversion for numeric hl stored as string works
-    _df = pd.DataFrame(
-        {
-            "estimate": numeric_as_string,
-            "ll": numeric_as_string,
-            "hl": numeric_as_string,
-        }
-    )
-    check_data(dataframe=_df, estimate="estimate", varlabel="estimate", ll="ll", hl="hl")
-
     # Assert that check for CI options are consistent works
     _df = pd.DataFrame({"estimate": numeric, "ll": string, "hl": string})
     with pytest.raises(TypeError) as excinfo:
@@ -192,6 +150,57 @@ def test_check_data():
         user_warning[0].message
     )
 
+    # Assert that warning for variable labels that are also group labels works
+    _df = pd.DataFrame(
+        {"varlabel": ["a", "Group1 ", "c"], "group": ["group1"] * 3, "estimate": numeric}
+    )
+    with pytest.warns(UserWarning) as user_warning:
+        check_data(dataframe=_df, estimate="estimate", varlabel="varlabel", groupvar="group")
+    assert any(
+        "Duplicates found in variable labels ('varlabel') and group labels ('groupvar')."
+        in str(warning.message)
+        for warning in user_warning
+    )
+
+    # Assert that varlabel in rightannote warns exactly once
+    _df = pd.DataFrame({"varlabel": ["a", "b", "c"], "estimate": numeric})
+    with pytest.warns(UserWarning) as user_warning:
+        check_data(
+            dataframe=_df, estimate="estimate", varlabel="varlabel", rightannote=["varlabel"]
+        )
+    rightannote_warnings = [
+        warning for warning in user_warning if '"rightannote"' in str(warning.message)
+    ]
+    assert len(rightannote_warnings) == 1
+
+
+@pytest.mark.parametrize(
+    "col,msg",
+    [
+        ("estimate", "Estimates should be float or int"),
+        ("ll", "CI lowerlimit values should be float or int"),
+        ("hl", "CI higherlimit values should be float or int"),
+    ],
+)
+def test_check_data_numeric(col, msg):
+    numeric = [-1, 2, 3.0]
+    _df = pd.DataFrame(
+        {"varlabel": ["a", "b", "c"], "estimate": numeric, "ll": numeric, "hl": numeric}
+    )
+
+    # Assert that assertion for numeric type works
+    _df[col] = ["a", "b", "c"]
+    with pytest.raises(TypeError) as excinfo:
+        check_data(dataframe=_df, estimate="estimate", varlabel="varlabel", ll="ll", hl="hl")
+    assert str(excinfo.value) == msg
+
+    # Assert that conversion for numeric data stored as string works
+    _df[col] = ["-1", "2", "3.0"]
+    result_df = check_data(
+        dataframe=_df, estimate="estimate", varlabel="varlabel", ll="ll", hl="hl"
+    )
+    assert result_df[col].tolist() == numeric
+
 
 def test_check_iterables_samelen():
     thresholds = (0.01, 0.05, 0.1)
@@ -1,9 +1,14 @@
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal, assert_series_equal
 
+from forestplot import dataframe_utils
 from forestplot.dataframe_utils import (
+    AVAILABLE_DATA,
+    _read_csv,
     insert_empty_row,
     insert_groups,
     load_data,
@@ -12,7 +17,10 @@ from forestplot.dataframe_utils import (
     sort_groups,
 )
 
+DATA_DIR = Path(__file__).resolve().parents[1] / "examples" / "data"
+
 
+@pytest.mark.slow
 def test_load_data():
     df = load_data("mortality")
     assert isinstance(df, pd.DataFrame)
@@ -28,6 +36,51 @@ def test_load_data():
     assert f"{dummy_name} not found." in str(excinfo.value)
 
 
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    """Read example data locally instead of over the network and record each fetch."""
+    calls = []
+
+    def fake_fetch_data(name, **param_dict):
+        calls.append(name)
+        return pd.read_csv(DATA_DIR / f"{name}.csv", **param_dict)
+
+    dataframe_utils._fetch_data_cached.cache_clear()
+    monkeypatch.setattr(dataframe_utils, "_fetch_data", fake_fetch_data)
+    yield calls
+    dataframe_utils._fetch_data_cached.cache_clear()
+
+
+def test_load_data_cached(fetch_calls):
+    # Assert each dataset is fetched once, whatever the casing or spacing of the name
+    first = load_data("Mortality")
+    second = load_data("mortality ")
+    assert fetch_calls == ["mortality"]
+    assert_frame_equal(first, second)
+
+    # Assert each call returns an independent copy
+    first.iloc[0, 0] = "changed"
+    assert_frame_equal(second, pd.read_csv(DATA_DIR / "mortality.csv"))
+
+    # Assert read options bypass the cache
+    load_data("mortality", nrows=2)
+    assert fetch_calls == ["mortality", "mortality"]
+
+
+@pytest.mark.parametrize("name", AVAILABLE_DATA)
+def test_read_csv_pyarrow(name):
+    # Assert the pyarrow engine parses the example data as the default engine does
+    pytest.importorskip("pyarrow")
+    path = DATA_DIR / f"{name}.csv"
+    assert_frame_equal(_read_csv(path), pd.read_csv(path))
+
+
+def test_read_csv_fallback():
+    # Assert options the pyarrow engine does not support fall back to the default engine
+    path = DATA_DIR / "sleep.csv"
+    assert_frame_equal(_read_csv(path, nrows=2), pd.read_csv(path, nrows=2))
+
+
 def test_insert_groups():
     input_df = pd.DataFrame({"varlabel": ["var1", "var2"], "groupvar": ["group1", "group1"]})
     correct_df = pd.DataFrame(
@@ -41,6 +94,19 @@ def test_insert_groups():
     assert_series_equal(result_df["groupvar"], correct_df["groupvar"])
     assert_series_equal(result_df["varlabel"], correct_df["varlabel"])
 
+    # Groups are kept in order of first appearance, with rows kept in their order
+    input_df = pd.DataFrame(
+        {"varlabel": ["var1", "var2", "var3"], "groupvar": ["group2", "group1", "group2"]}
+    )
+    correct_df = pd.DataFrame(
+        {
+            "varlabel": ["group2", "var1", "var3", "group1", "var2"],
+            "groupvar": ["group2", "group2", "group2", "group1", "group1"],
+        }
+    )
+    result_df = insert_groups(input_df, groupvar="groupvar", varlabel="varlabel")
+    assert_frame_equal(result_df, correct_df)
+
 
 def test_sort_data():
     input_string = ["c", "a", "b"]
@@ -86,6 +152,10 @@ def test_reverse_dataframe():
     result_df = reverse_dataframe(input_df)
     assert_frame_equal(result_df, correct_df)
 
+    # Assert the result does not share data with the input
+    result_df.loc[0, "estimate"] = 9
+    assert input_df["estimate"].tolist() == input_numeric
+
 
 def test_insert_empty_row():
     input_string = ["a", "b", "c"]
@@ -1,8 +1,6 @@
-import warnings
-
-warnings.filterwarnings("ignore")
 import matplotlib.pyplot as plt
 import pandas as pd
+import pytest
 from matplotlib.pyplot import Axes
 
 from forestplot.graph_utils import (
@@ -23,24 +21,8 @@ from forestplot.graph_utils import (
     right_flush_yticklabels,
 )
 
-x, y = [0, 1, 2], [0, 1, 2]
-str_vector = ["a", "b", "c"]
-input_df = pd.DataFrame(
-    {
-        "yticklabel": str_vector,
-        "estimate": x,
-        "moerror": y,
-        "ll": x,
-        "hl": y,
-        "pval": y,
-        "formatted_pval": y,
-        "yticklabel1": str_vector,
-        "yticklabel2": str_vector,
-    }
-)
-
 
-def test_draw_ci():
+def test_draw_ci(input_df):
     _, ax = plt.subplots()
     ax = draw_ci(
         dataframe=input_df,
@@ -60,7 +42,7 @@ def test_draw_ci():
     assert (all(isinstance(tick, int)) for tick in ax.get_yticks())
 
 
-def test_draw_est_markers():
+def test_draw_est_markers(input_df):
     _, ax = plt.subplots()
 
     ax = draw_est_markers(input_df, estimate="estimate", yticklabel="yticklabel", ax=ax)
@@ -78,13 +60,13 @@ def test_draw_est_markers():
     assert xmax >= input_df["estimate"].max()
 
 
-def test_draw_ref_xline():
+def test_draw_ref_xline(input_df):
     _, ax = plt.subplots()
     ax = draw_ref_xline(ax, dataframe=input_df, annoteheaders=None, right_annoteheaders=None)
     assert isinstance(ax, Axes)
 
 
-def test_right_flush_yticklabels():
+def test_right_flush_yticklabels(input_df):
     _, ax = plt.subplots()
     pad = right_flush_yticklabels(input_df, yticklabel="yticklabel", flush=True, ax=ax)
     assert isinstance(pad, float)
@@ -285,35 +267,23 @@ def test_draw_alt_row_colors():
     assert isinstance(ax, Axes)
 
 
-def test_draw_tablelines():
-    _, ax = plt.subplots()
-    draw_tablelines(input_df, righttext_width=0, pval=None, right_annoteheaders=None, ax=ax)
-    assert isinstance(ax, Axes)
-    assert len(ax.get_lines()) == 2
-
-    _, ax = plt.subplots()
-    draw_tablelines(
-        input_df,
-        righttext_width=0,
-        pval="pval",
-        right_annoteheaders=["right_annoteheaders"],
-        ax=ax,
-    )
-    assert isinstance(ax, Axes)
-    assert len(ax.get_lines()) == 4
-
-    _, ax = plt.subplots()
-    draw_tablelines(input_df, righttext_width=0, pval="pval", right_annoteheaders=None, ax=ax)
-    assert isinstance(ax, Axes)
-    assert len(ax.get_lines()) == 4
-
+@pytest.mark.parametrize(
+    "pval,right_annoteheaders,n_lines",
+    [
+        (None, None, 2),
+        ("pval", ["right_annoteheaders"], 4),
+        ("pval", None, 4),
+        (None, ["right_annoteheaders"], 4),
+    ],
+)
+def test_draw_tablelines(input_df, pval, right_annoteheaders, n_lines):
     _, ax = plt.subplots()
     draw_tablelines(
         input_df,
         righttext_width=0,
-        pval=None,
-        right_annoteheaders=["right_annoteheaders"],
+        pval=pval,
+        right_annoteheaders=right_annoteheaders,
         ax=ax,
     )
     assert isinstance(ax, Axes)
-    assert len(ax.get_lines()) == 4
+    assert len(ax.get_lines()) == n_lines
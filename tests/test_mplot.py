@@ -1,10 +1,13 @@
+from pathlib import Path
+
 import pandas as pd
 from matplotlib.pyplot import Axes
 
 from forestplot import mforestplot
 
+# Read the copy shipped in examples/data so that collection does not hit the network
 dataname = "sleep-mmodel"
-data = f"https://raw.githubusercontent.com/lsys/forestplot/mplot/examples/data/{dataname}.csv"
+data = Path(__file__).resolve().parents[1] / "examples" / "data" / f"{dataname}.csv"
 df = pd.read_csv(data)
 
 
@@ -12,26 +12,11 @@ from forestplot.mplot_graph_utils import (
     mdraw_yticklabels,
 )
 
-x, y = [0, 1, 2], [0, 1, 2]
-str_vector = ["a", "b", "c"]
 models_vector = ["m1", "m1", "m2"]
-input_df = pd.DataFrame(
-    {
-        "yticklabel": str_vector,
-        "model": models_vector,
-        "estimate": x,
-        "moerror": y,
-        "ll": x,
-        "hl": y,
-        "pval": y,
-        "formatted_pval": y,
-        "yticklabel1": str_vector,
-        "yticklabel2": str_vector,
-    }
-)
+models = sorted(set(models_vector))  # fixed order, set order varies between runs
 
 
-def test_mdraw_ref_xline():
+def test_mdraw_ref_xline(input_df):
     _, ax = plt.subplots()
     ax = mdraw_ref_xline(
         ax,
@@ -62,13 +47,13 @@ def test_mdraw_yticklabels():
     assert [label.get_text() for label in ax.get_yticklabels()] == str_vector
 
 
-def test_mdraw_est_markers():
+def test_mdraw_est_markers(input_df):
     _, ax = plt.subplots()
     ax = mdraw_est_markers(
         input_df,
         estimate="estimate",
         model_col="model",
-        models=list(set(models_vector)),
+        models=models,
         ax=ax,
     )
     assert isinstance(ax, Axes)
@@ -77,10 +62,10 @@ def test_mdraw_est_markers():
     xmin, xmax = ax.get_xlim()
     assert xmin <= input_df["estimate"].min()
     assert xmax >= input_df["estimate"].max()
-    assert len(ax.collections) == len(set(models_vector))
+    assert len(ax.collections) == len(models)
 
 
-def test_mdraw_ci():
+def test_mdraw_ci(input_df):
     _, ax = plt.subplots()
 
     # Call the function
@@ -90,14 +75,14 @@ def test_mdraw_ci():
         ll="ll",
         hl="hl",
         model_col="model",
-        models=list(set(models_vector)),
+        models=models,
         logscale=False,
         ax=ax,
     )
 
     # Assertions
     assert isinstance(ax, Axes)
-    assert len(ax.collections) == len(set(models_vector))
+    assert len(ax.collections) == len(models)
 
 
 def test_mdraw_legend():
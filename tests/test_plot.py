@@ -1,12 +1,18 @@
 #!/usr/bin/env python
 # coding: utf-8
+from pathlib import Path
+
 import pandas as pd
+import pytest
 from matplotlib.pyplot import Axes
 
 from forestplot import forestplot
 
+pytestmark = pytest.mark.slow
+
+# Read the copy shipped in examples/data so that collection does not hit the network
 dataname = "sleep"
-data = f"https://raw.githubusercontent.com/lsys/pyforestplot/main/examples/data/{dataname}.csv"
+data = Path(__file__).resolve().parents[1] / "examples" / "data" / f"{dataname}.csv"
 df = pd.read_csv(data).assign(n=lambda df: df["n"].map(str))
 
 # fmt: off
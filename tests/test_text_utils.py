@@ -3,10 +3,14 @@ import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal, assert_series_equal
 
+from forestplot.dataframe_utils import insert_groups
 from forestplot.text_utils import (
+    _format_annotations,
+    _get_groups,
     _get_max_varlen,
     _remove_est_ci,
     _right_justify_num,
+    _right_justify_nums,
     form_est_ci,
     format_varlabels,
     indent_nongroupvar,
@@ -18,20 +22,24 @@ from forestplot.text_utils import (
 )
 
 
-def test_star_pval():
-    # Test 1
-    _df = pd.DataFrame({"pval": [0.0001, 0.040, 0.090, 0.500]})
-    correct_df = pd.DataFrame({"formatted_pval": ["0.0***", "0.04**", "0.09*", "0.5"]})
-    result_df = star_pval(_df, pval="pval", starpval=True, decimal_precision=2)
-    assert_series_equal(result_df.formatted_pval, correct_df.formatted_pval)
+@pytest.mark.parametrize(
+    "pvals,decimal_precision,expected",
+    [
+        ([0.0001, 0.040, 0.090, 0.500], 2, ["0.0***", "0.04**", "0.09*", "0.5"]),
+        ([0.0011, 0.042, 0.091, 0.512], 3, ["0.001***", "0.042**", "0.091*", "0.512"]),
+        # Assert things work when pval is empty
+        ([0.0001, np.nan, 0.090, 0.500], 2, ["0.0***", "", "0.09*", "0.5"]),
+    ],
+)
+def test_star_pval(pvals, decimal_precision, expected):
+    _df = pd.DataFrame({"pval": pvals})
+    result_df = star_pval(_df, pval="pval", starpval=True, decimal_precision=decimal_precision)
+    assert_series_equal(result_df.formatted_pval, pd.Series(expected, name="formatted_pval"))
 
-    # Test 2
-    _df = pd.DataFrame({"pval": [0.0011, 0.042, 0.091, 0.512]})
-    correct_df = pd.DataFrame({"formatted_pval": ["0.001***", "0.042**", "0.091*", "0.512"]})
-    result_df = star_pval(_df, pval="pval", starpval=True, decimal_precision=3)
-    assert_series_equal(result_df.formatted_pval, correct_df.formatted_pval)
 
+def test_star_pval_thresholds():
     # Assert assertion that  P-value thresholds and symbols list must be of same length works
+    _df = pd.DataFrame({"pval": [0.0011, 0.042, 0.091, 0.512]})
     with pytest.raises(Exception) as excinfo:
         star_pval(
             _df,
@@ -43,11 +51,31 @@ def test_star_pval():
         )
     assert str(excinfo.value) == "Iterables not of the same length."
 
-    # Assert things work when pval is empty
-    _df = pd.DataFrame({"pval": [0.0001, np.nan, 0.090, 0.500]})
-    correct_df = pd.DataFrame({"formatted_pval": ["0.0***", "", "0.09*", "0.5"]})
+    # Thresholds are inclusive, and unsorted thresholds use the first one matched
+    _df = pd.DataFrame({"pval": [0.01, 0.05, 0.1, 0.2]})
+    correct_df = pd.DataFrame({"formatted_pval": ["0.01***", "0.05**", "0.1*", "0.2"]})
     result_df = star_pval(_df, pval="pval", starpval=True, decimal_precision=2)
     assert_series_equal(result_df.formatted_pval, correct_df.formatted_pval)
+    correct_df = pd.DataFrame({"formatted_pval": ["0.01a", "0.05a", "0.1b", "0.2"]})
+    result_df = star_pval(
+        _df,
+        pval="pval",
+        starpval=True,
+        decimal_precision=2,
+        thresholds=(0.05, 0.1),
+        symbols=("a", "b"),
+    )
+    assert_series_equal(result_df.formatted_pval, correct_df.formatted_pval)
+    correct_df = pd.DataFrame({"formatted_pval": ["0.01b", "0.05b", "0.1b", "0.2"]})
+    result_df = star_pval(
+        _df,
+        pval="pval",
+        starpval=True,
+        decimal_precision=2,
+        thresholds=(0.1, 0.05),
+        symbols=("b", "a"),
+    )
+    assert_series_equal(result_df.formatted_pval, correct_df.formatted_pval)
 
 
 def test_get_max_varlen():
@@ -55,17 +83,50 @@ def test_get_max_varlen():
     assert _get_max_varlen(_df, varlabel="col", extrapad=0) == 6
     assert _get_max_varlen(_df, varlabel="col", extrapad=2) == 6 + 2
 
+    # Missing values count as printed ('nan'), as in the formatted annotation columns
+    _df = pd.DataFrame({"col": [np.nan, "a", "bb"]})
+    assert _get_max_varlen(_df, varlabel="col", extrapad=0) == 3
+    _df = pd.DataFrame({"col": []}, dtype=object)
+    assert _get_max_varlen(_df, varlabel="col", extrapad=1) == 1
+
 
-def test_right_justify_num():
+def test_get_groups():
+    _df = pd.DataFrame({"group": ["Group1", "group1 ", "GROUP2", np.nan]})
+    assert _get_groups(_df, groupvar="group") == frozenset(["group1", "group2"])
+    assert _get_groups(_df, groupvar=None) == frozenset()
+
+
+@pytest.mark.parametrize(
+    "decimal_precision,expected",
+    [
+        (2, [" -0.12", " 11.23", "-12.00"]),
+        (3, [" -0.123", " 11.234", "-12.000"]),
+    ],
+)
+def test_right_justify_num(decimal_precision, expected):
     _df = pd.DataFrame({"col": [-0.123, 11.234, -12.0]})
-    correct_df = pd.DataFrame({"formatted_col": [" -0.12", " 11.23", "-12.00"]})
-    result_df = _right_justify_num(dataframe=_df, col="col", decimal_precision=2)
-    assert_series_equal(result_df.formatted_col, correct_df.formatted_col)
+    result_df = _right_justify_num(
+        dataframe=_df, col="col", decimal_precision=decimal_precision
+    )
+    assert_series_equal(result_df.formatted_col, pd.Series(expected, name="formatted_col"))
 
-    # deicmal precision = 3
-    correct_df = pd.DataFrame({"formatted_col": [" -0.123", " 11.234", "-12.000"]})
-    result_df = _right_justify_num(dataframe=_df, col="col", decimal_precision=3)
-    assert_series_equal(result_df.formatted_col, correct_df.formatted_col)
+
+def test_right_justify_nums():
+    _df = pd.DataFrame({"est": [-0.123, 11.234, -12.0], "ll": [1, 2, 3]})
+    result_df = _right_justify_nums(dataframe=_df, cols=["est", "ll"], decimal_precision=2)
+    # Each column is padded to its own max length
+    correct_df = pd.DataFrame(
+        {
+            "formatted_est": [" -0.12", " 11.23", "-12.00"],
+            "formatted_ll": ["1.00", "2.00", "3.00"],
+        }
+    )
+    assert_series_equal(result_df.formatted_est, correct_df.formatted_est)
+    assert_series_equal(result_df.formatted_ll, correct_df.formatted_ll)
+
+    # Reformatting with another precision replaces the formatted column
+    result_df = _right_justify_nums(dataframe=result_df, cols=["est"], decimal_precision=3)
+    assert result_df.formatted_est.tolist() == [" -0.123", " 11.234", "-12.000"]
 
 
 def test_indent_nongroupvar():
@@ -321,6 +382,20 @@ def test_format_varlabels():
     assert_frame_equal(result_df, correct_df)
 
 
+def test_format_annotations():
+    input_df = pd.DataFrame({"info": ["a", "bb", "c"], "n": [1, 20, 300]})
+    result_df = _format_annotations(input_df, annote=["info", "n"], annoteheaders=None)
+    assert result_df["formatted_info"].tolist() == ["a ", "bb", "c "]
+    assert result_df["formatted_n"].tolist() == ["1  ", "20 ", "300"]
+
+    # Pad to header length if header is longer
+    result_df = _format_annotations(
+        input_df, annote=["info", "n"], annoteheaders=["Info", "N"]
+    )
+    assert result_df["formatted_info"].tolist() == ["a   ", "bb  ", "c   "]
+    assert result_df["formatted_n"].tolist() == ["1  ", "20 ", "300"]
+
+
 def test_prep_annote():
     # Assert things work when there is group exists
     numeric = [1, 2, 3]
@@ -371,6 +446,17 @@ def test_prep_annote():
     )
     assert_frame_equal(result_df, correct_df)
 
+    # Assert multiple annotations are joined with col_spacing
+    result_df = prep_annote(
+        input_df,
+        annote=["info", "estimate"],
+        annoteheaders=None,
+        varlabel="var",
+        groupvar="groupvar",
+        col_spacing=1,
+    )
+    assert result_df["yticklabel"].tolist() == ["group", "var1  b 2", "var2  c 3"]
+
 
 def test_prep_rightannote():
     # Assert things work when there is group exists
@@ -425,12 +511,33 @@ def test_prep_rightannote():
     )
     assert_frame_equal(result_df, correct_df)
 
+    # Assert multiple annotations are joined with col_spacing
+    result_df = prep_rightannnote(
+        input_df,
+        rightannote=["info", "estimate"],
+        right_annoteheaders=None,
+        varlabel="var",
+        groupvar="groupvar",
+        col_spacing=1,
+    )
+    assert result_df["yticklabel2"].tolist() == ["", "b 2", "c 3"]
 
-def test_make_tableheaders():
-    var = ["group", "var1", "var2"]
-    input_df = pd.DataFrame(
+    # Assert an empty rightannote gives empty labels
+    result_df = prep_rightannnote(
+        input_df,
+        rightannote=[],
+        right_annoteheaders=None,
+        varlabel="var",
+        groupvar="groupvar",
+    )
+    assert result_df["yticklabel2"].tolist() == ["", "", ""]
+
+
+@pytest.fixture
+def tableheaders_input():
+    return pd.DataFrame(
         {
-            "var": var,
+            "var": ["group", "var1", "var2"],
             "groupvar": ["group", "group", "group"],
             "estimate": [1, 2, 3],
             "info": ["a", "b", "c"],
@@ -439,6 +546,22 @@ def test_make_tableheaders():
             "yticklabel2": ["", "b   ", "c   "],
         }
     )
+
+
+@pytest.mark.parametrize(
+    "annoteheaders,right_annoteheaders,left_header,right_header",
+    [
+        (["left head"], ["right head"], "Variable  left head", "right head"),
+        # Assert things work if no rightheaders specified
+        (["left head"], None, "Variable  left head", ""),
+        # Assert things work if no leftheaders specified
+        (None, ["right head"], "Variable", "right head"),
+    ],
+)
+def test_make_tableheaders(
+    tableheaders_input, annoteheaders, right_annoteheaders, left_header, right_header
+):
+    input_df = tableheaders_input
     correct_df = pd.DataFrame(
         {
             "var": [np.nan, "group", "var1", "var2"],
@@ -446,23 +569,26 @@ def test_make_tableheaders():
             "estimate": [np.nan, 1, 2, 3],
             "info": [np.nan, "a", "b", "c"],
             "fomatted_info": [np.nan, "a   ", "b   ", "c   "],
-            "yticklabel": ["Variable  left head", "group", "var1  b", "var2  c"],
-            "yticklabel2": ["right head", "", "b   ", "c   "],
+            "yticklabel": [left_header, "group", "var1  b", "var2  c"],
+            "yticklabel2": [right_header, "", "b   ", "c   "],
         }
     )
     result_df = make_tableheaders(
         input_df,
         varlabel="var",
         annote=["info"],
-        annoteheaders=["left head"],
+        annoteheaders=annoteheaders,
         rightannote=["info"],
-        right_annoteheaders=["right head"],
+        right_annoteheaders=right_annoteheaders,
         groupvar="groupvar",
     )
     assert len(result_df) == 1 + len(input_df)
     assert_frame_equal(result_df, correct_df)
 
+
+def test_make_tableheaders_no_headers(tableheaders_input):
     # Assert things work if no headers specified
+    input_df = tableheaders_input
     result_df = make_tableheaders(
         input_df,
         varlabel="var",
@@ -475,50 +601,35 @@ def test_make_tableheaders():
     assert len(result_df) == len(input_df)
     assert_frame_equal(result_df, input_df)
 
-    # Assert things work if no rightheaders specified
-    correct_df = pd.DataFrame(
+
+@pytest.mark.parametrize("groupvar", ["groupvar", None])
+def test_make_tableheaders_alignment(groupvar):
+    # Assert headers sit over their columns, with or without (NaN-filled) group rows
+    input_df = pd.DataFrame(
         {
-            "var": [np.nan, "group", "var1", "var2"],
-            "groupvar": [np.nan, "group", "group", "group"],
-            "estimate": [np.nan, 1, 2, 3],
-            "info": [np.nan, "a", "b", "c"],
-            "fomatted_info": [np.nan, "a   ", "b   ", "c   "],
-            "yticklabel": ["Variable  left head", "group", "var1  b", "var2  c"],
-            "yticklabel2": ["", "", "b   ", "c   "],
+            "var": ["variable1", "variable2", "variable3"],
+            "groupvar": ["group1", "group1", "group2"],
+            "k": ["70", "71", "72"],
+            "power": [0.25, 0.5, 0.75],
         }
     )
-    result_df = make_tableheaders(
+    if groupvar is not None:
+        input_df = insert_groups(input_df, groupvar=groupvar, varlabel="var")
+    result_df = prep_annote(
         input_df,
+        annote=["k", "power"],
+        annoteheaders=["K", "Power"],
         varlabel="var",
-        annote=["info"],
-        annoteheaders=["left head"],
-        rightannote=["info"],
-        right_annoteheaders=None,
-        groupvar="groupvar",
-    )
-    assert len(result_df) == 1 + len(input_df)
-    assert_frame_equal(result_df, correct_df)
-
-    # Assert things work if no leftheaders specified
-    correct_df = pd.DataFrame(
-        {
-            "var": [np.nan, "group", "var1", "var2"],
-            "groupvar": [np.nan, "group", "group", "group"],
-            "estimate": [np.nan, 1, 2, 3],
-            "info": [np.nan, "a", "b", "c"],
-            "fomatted_info": [np.nan, "a   ", "b   ", "c   "],
-            "yticklabel": ["Variable", "group", "var1  b", "var2  c"],
-            "yticklabel2": ["right head", "", "b   ", "c   "],
-        }
+        groupvar=groupvar,
     )
     result_df = make_tableheaders(
-        input_df,
+        result_df,
         varlabel="var",
-        annote=["info"],
-        annoteheaders=None,
-        rightannote=["info"],
-        right_annoteheaders=["right head"],
-        groupvar="groupvar",
+        annote=["k", "power"],
+        annoteheaders=["K", "Power"],
+        rightannote=None,
+        right_annoteheaders=None,
     )
-    assert len(result_df) == 1 + len(input_df)
-    assert_frame_equal(result_df, correct_df)
+    header, row = result_df["yticklabel"].iloc[0], result_df["yticklabel"].iloc[-1]
+    assert header.index("K") == row.index("72")
+    assert header.index("Power") == row.index("0.75")